@@ -1,6 +1,5 @@
 import json
 import pathlib
-import re
 import subprocess
 
 import filelock
@@ -115,9 +114,9 @@ class SyslogMessageMatcher:
 
     @log_sync.hookimpl
     def log_sync_filter(self, msg):
-        return log_filter.RegexLogFilter(
+        return log_filter.SuffixLogFilter(
             name=self.syslogger.name,
-            pattern=f': {re.escape(msg)}$'
+            suffix=f': {msg}'
         )
 
 
@@ -62,13 +62,9 @@ class ContainerFixtures:
             c.rm(timeout=self.START_STOP_TIMEOUT_SEC)
 
     def configure_session(self, container, request):
-        container.enable_welcome_dialog(
-            self.ENABLE_WELCOME_DIALOG,
-            timeout=self.START_STOP_TIMEOUT_SEC
-        )
-
-        container.enable_lock_screen_warning(
-            self.ENABLE_LOCK_SCREEN_WARNING,
+        container.configure_session(
+            welcome_dialog=self.ENABLE_WELCOME_DIALOG,
+            lock_screen_warning=self.ENABLE_LOCK_SCREEN_WARNING,
             timeout=self.START_STOP_TIMEOUT_SEC
         )
 
@@ -1,7 +1,13 @@
+import functools
 import json
 import logging
+import pathlib
+import selectors
 import shlex
 import subprocess
+import tempfile
+import time
+import uuid
 
 
 LOGGER = logging.getLogger(__name__)
@@ -11,6 +17,11 @@ class Podman:
     DEFAULT_TIMEOUT = 2
 
     def __init__(self, *args, timeout=DEFAULT_TIMEOUT, **kwargs):
+        # All file descriptors opened by Python (and GLib) are O_CLOEXEC anyway,
+        # and close_fds=False lets subprocess skip the fd closing loop in the child
+        # (and use posix_spawn() when possible).
+        kwargs.setdefault('close_fds', False)
+
         self.args = args if args else ('podman',)
         self.timeout = timeout
         self.kwargs = kwargs
@@ -59,6 +70,103 @@ class Podman:
         return subprocess.Popen(cmd, **kwargs)
 
 
+class Shell:
+    def __init__(self, proc):
+        self.proc = proc
+        self.buffer = bytearray()
+
+    def close(self, timeout=None):
+        self.proc.stdin.close()
+
+        try:
+            self.proc.wait(timeout=timeout)
+
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait()
+
+        self.proc.stdout.close()
+
+    def read_until(self, terminator, deadline):
+        with selectors.DefaultSelector() as selector:
+            selector.register(self.proc.stdout, selectors.EVENT_READ)
+
+            while True:
+                pos = self.buffer.find(terminator)
+
+                if pos != -1:
+                    data = bytes(self.buffer[:pos])
+                    del self.buffer[:pos + len(terminator)]
+                    return data
+
+                timeout = deadline - time.monotonic()
+
+                if timeout <= 0 or not selector.select(timeout):
+                    raise TimeoutError()
+
+                chunk = self.proc.stdout.read(65536)
+
+                if not chunk:
+                    raise RuntimeError(f'Shell process exited unexpectedly: {self.proc}')
+
+                self.buffer += chunk
+
+    def __call__(self, script, *, timeout, check=True):
+        deadline = time.monotonic() + timeout
+        marker = f'--- {uuid.uuid4().hex} exit code:'.encode()
+
+        LOGGER.info('%r: starting in shell', script)
+
+        self.proc.stdin.write(
+            b'{\n' + script.encode() + b'\n} </dev/null 2>&1; printf "\\n%s %d\\n" "' +
+            marker + b'" "$?"\n'
+        )
+        self.proc.stdin.flush()
+
+        try:
+            stdout = self.read_until(b'\n' + marker + b' ', deadline)
+            returncode = int(self.read_until(b'\n', deadline))
+
+        except TimeoutError:
+            raise subprocess.TimeoutExpired(script, timeout)
+
+        proc = subprocess.CompletedProcess(script, returncode, stdout)
+
+        if returncode == 0:
+            LOGGER.info('%r: completed stdout: %r', script, stdout)
+            return proc
+
+        ex = subprocess.CalledProcessError(returncode, script, stdout)
+        LOGGER.info('%s stdout: %r', ex, stdout)
+
+        if check:
+            raise ex
+
+        return proc
+
+
+@functools.lru_cache
+def create_options(volumes, publish, cap_add, tty, user):
+    args = ['container', 'create', '--pull=never', '--log-driver=none']
+
+    if tty:
+        args.append('--tty')
+
+    for volume_spec in volumes:
+        args.extend(('--volume', ':'.join(str(part) for part in volume_spec)))
+
+    for port_spec in publish:
+        args.extend(('--publish', ':'.join(str(part) for part in port_spec)))
+
+    if cap_add:
+        args.extend(('--cap-add', ','.join(cap_add)))
+
+    if user:
+        args.extend(('--user', str(user)))
+
+    return tuple(args)
+
+
 class Container:
     def __init__(
         self,
@@ -74,30 +182,26 @@ class Container:
     ):
         self.podman = podman
         self.console = None
+        self.shell = None
+        self.ports = None
+
+        args = create_options(
+            volumes=tuple(tuple(volume_spec) for volume_spec in volumes),
+            publish=tuple(tuple(port_spec) for port_spec in publish),
+            cap_add=tuple(cap_add),
+            tty=tty,
+            user=user
+        )
 
-        args = ['container', 'create', '--pull=never', '--log-driver=none']
-
-        if tty:
-            args.append('--tty')
-
-        for volume_spec in volumes:
-            args.extend(('--volume', ':'.join(str(part) for part in volume_spec)))
-
-        for port_spec in publish:
-            args.extend(('--publish', ':'.join(str(part) for part in port_spec)))
-
-        if cap_add:
-            args.extend(('--cap-add', ','.join(cap_add)))
-
-        if user:
-            args.extend(('--user', str(user)))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cidfile = pathlib.Path(tmpdir) / 'cid'
 
-        args.append(image)
-        args.extend(cmd)
+            podman(
+                *args, f'--cidfile={cidfile}', image, *cmd,
+                **kwargs, stdout=subprocess.DEVNULL
+            )
 
-        self.container_id = podman(
-            *args, **kwargs, stdout=subprocess.PIPE, text=True
-        ).stdout.strip()
+            self.container_id = cidfile.read_text().strip()
 
     def rm(self, *, timeout=None, **kwargs):
         timeout = self.podman.timeout if timeout is None else timeout
@@ -111,10 +215,17 @@ class Container:
             self.console.wait(timeout=timeout)
             self.console = None
 
+        if self.shell:
+            self.shell.close(timeout=timeout)
+            self.shell = None
+
     def start(self, **kwargs):
         if self.console is not None:
             raise RuntimeError(f'There is already a console process: {self.console}')
 
+        # Published ports are allocated on start
+        self.ports = None
+
         self.console = self.podman.bg(
             'container', 'start', '--attach', '--sig-proxy=false', self.container_id,
             stdin=subprocess.DEVNULL, stdout=None, stderr=None
@@ -140,16 +251,40 @@ class Container:
             'container', 'exec', *exec_args, self.container_id, *args, **kwargs
         )
 
+    def sh(self, script, *, timeout=None, check=True):
+        # Runs the script in a persistent 'podman exec' session - much cheaper
+        # than exec() for short commands. stdin is /dev/null, stderr is merged into stdout,
+        # and the script always runs as the container's default user.
+        timeout = self.podman.timeout if timeout is None else timeout
+
+        if self.shell is None:
+            self.shell = Shell(self.podman.bg(
+                'container', 'exec', '--interactive', self.container_id, 'sh',
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=None, bufsize=0
+            ))
+
+        try:
+            return self.shell(script, timeout=timeout, check=check)
+
+        except subprocess.CalledProcessError:
+            raise
+
+        except BaseException:
+            # The session is dead or in an unknown state now, start a new one next time
+            self.shell.close(timeout=0)
+            self.shell = None
+            raise
+
     def inspect(self, format='.', **kwargs):
         return json.loads(self.podman(
-            'container', 'inspect', f'--format={{json {format}}}', self.container_id,
+            'container', 'inspect', f'--format={{{{json {format}}}}}', self.container_id,
             **kwargs, stdout=subprocess.PIPE  # text=True not required!
         ).stdout)
 
     def get_port(self, port, **kwargs):
-        host, port = self.podman(
-            'container', 'port', self.container_id, str(port),
-            **kwargs, stdout=subprocess.PIPE, text=True
-        ).stdout.strip().split(':', 1)
+        if self.ports is None:
+            self.ports = self.inspect('.NetworkSettings.Ports', **kwargs)
+
+        binding = self.ports[f'{port}/tcp'][0]
 
-        return host, int(port)
+        return binding['HostIp'] or '0.0.0.0', int(binding['HostPort'])
@@ -20,11 +20,8 @@ class CoreutilsContainer(container_util.Container):
             with contextlib.suppress(ValueError):
                 return int(user.split(':', maxsplit=1)[0])
 
-        uid = int(
-            self.exec(
-                'id', '-u', **kwargs, user=user, stdout=subprocess.PIPE, text=True
-            ).stdout.strip()
-        )
+        # int() accepts bytes and ignores surrounding whitespace
+        uid = int(self.exec('id', '-u', **kwargs, user=user, stdout=subprocess.PIPE).stdout)
 
         self._uid_cache[user] = uid
         return uid
@@ -212,6 +212,52 @@ def connect_tcp(host, port, timeout=None):
     return sync.run(timeout)
 
 
+def call_many(proxy, calls, timeout=None):
+    if not calls:
+        return []
+
+    if timeout is None:
+        timeout = proxy.get_default_timeout()
+
+    sync = glib_util.SyncCall()
+    results = [None] * len(calls)
+    pending = len(calls)
+
+    def callback(source, result, index):
+        nonlocal pending
+
+        if sync.done:
+            return
+
+        try:
+            reply = source.call_finish(result).unpack()
+
+        except GLib.Error as ex:
+            sync.set_exception(ex)
+            sync.cancellable.cancel()
+            return
+
+        results[index] = reply[0] if len(reply) == 1 else reply
+        pending -= 1
+
+        if pending == 0:
+            sync.set_result(results)
+
+    # Send all calls at once, so the total latency is one round trip, not len(calls)
+    for index, (method_name, parameters) in enumerate(calls):
+        proxy.call(
+            method_name,
+            parameters,
+            Gio.DBusCallFlags.NONE,
+            timeout,
+            sync.cancellable,
+            callback,
+            index
+        )
+
+    return sync.run(timeout)
+
+
 def set_property(proxy, property_name, value, timeout=None):
     if_info = proxy.get_interface_info()
 
@@ -1,3 +1,4 @@
+import concurrent.futures
 import json
 import pathlib
 import time
@@ -113,6 +114,23 @@ class GnomeContainer(systemd_container.SystemdContainer):
 
             return self.touch(path, **kwargs, timeout=deadline - time.monotonic())
 
+    def configure_session(self, *, welcome_dialog, lock_screen_warning, timeout=_DEFAULT):
+        if timeout is _DEFAULT:
+            timeout = self.podman.timeout
+
+        # Independent settings - run them concurrently, so the total time is
+        # the slowest one rather than the sum
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            futures = [
+                executor.submit(self.enable_welcome_dialog, welcome_dialog, timeout=timeout),
+                executor.submit(
+                    self.enable_lock_screen_warning, lock_screen_warning, timeout=timeout
+                ),
+            ]
+
+        for future in futures:
+            future.result()
+
     @staticmethod
     def extensions_system_install_path():
         return EXTENSIONS_INSTALL_DIR_SYSTEM
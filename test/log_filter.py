@@ -2,6 +2,7 @@ import contextlib
 import logging.handlers
 import queue
 import re
+import threading
 
 
 class RegexLogFilter(logging.Filter):
@@ -22,6 +23,67 @@ class RegexLogFilter(logging.Filter):
         return bool(self.pattern.search(message))
 
 
+class SuffixLogFilter(logging.Filter):
+    def __init__(self, suffix, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Same as regex '$' - allow a single trailing newline
+        self.suffixes = (suffix, suffix + '\n')
+
+    def filter(self, record):
+        if not super().filter(record):
+            return False
+
+        message = record.message if hasattr(record, 'message') else record.getMessage()
+
+        return message.endswith(self.suffixes)
+
+
+class CaptureHandler(logging.Handler):
+    # Captures are added and removed from the test thread, while records are
+    # emitted from SyslogServer thread. Instead of locking on every record,
+    # writers swap an immutable tuple, and emit() just reads the current one.
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.captures = ()
+        self.captures_lock = threading.Lock()
+
+    def add_capture(self, handler):
+        with self.captures_lock:
+            self.captures = self.captures + (handler,)
+
+    def remove_capture(self, handler):
+        with self.captures_lock:
+            self.captures = tuple(h for h in self.captures if h is not handler)
+
+    def handle(self, record):
+        # No need for the handler lock, see above
+        self.emit(record)
+        return record
+
+    def emit(self, record):
+        for handler in self.captures:
+            handler.handle(record)
+
+
+CAPTURE_HANDLERS = {}
+CAPTURE_HANDLERS_LOCK = threading.Lock()
+
+
+def get_capture_handler(logger):
+    with CAPTURE_HANDLERS_LOCK:
+        handler = CAPTURE_HANDLERS.get(logger)
+
+        if handler is None:
+            handler = CaptureHandler()
+            logger.addHandler(handler)
+            CAPTURE_HANDLERS[logger] = handler
+
+        return handler
+
+
 @contextlib.contextmanager
 def capture_logs(filter, logger=None, to_queue=None):
     if to_queue is None:
@@ -33,9 +95,12 @@ def capture_logs(filter, logger=None, to_queue=None):
     handler = logging.handlers.QueueHandler(to_queue)
     handler.addFilter(filter)
 
-    logger.addHandler(handler)
+    # logging.Logger.addHandler()/removeHandler() modify the handler list in place,
+    # while other threads may be iterating over it - keep one persistent handler instead
+    capture_handler = get_capture_handler(logger)
+    capture_handler.add_capture(handler)
 
     try:
         yield to_queue
     finally:
-        logger.removeHandler(handler)
+        capture_handler.remove_capture(handler)
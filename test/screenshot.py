@@ -8,6 +8,9 @@ import wand.image
 import Xlib.X
 
 
+PNG_FAST_COMPRESSION_QUALITY = 10
+
+
 class StorageType(enum.IntEnum):
     UndefinedPixel = 0
     CharPixel = enum.auto()
@@ -56,6 +59,11 @@ def screenshot(display, format='png'):
             image.data
         )
 
+        if format == 'png':
+            # zlib level 1, no filtering - encoding is on the critical path of the
+            # test report, a slightly bigger file is a better trade-off
+            wand_image.compression_quality = PNG_FAST_COMPRESSION_QUALITY
+
         return wand_image.make_blob(format)
 
 
@@ -1,3 +1,5 @@
+import functools
+
 from gi.repository import GLib
 
 from . import dbus_util, glib_util
@@ -63,7 +65,7 @@ class GnomeShellDBusApi:
 
         return info
 
-    @property
+    @functools.cached_property
     def version(self):
         version_str = self.extensions_interface.get_cached_property('ShellVersion').unpack()
 
@@ -2,6 +2,7 @@ import contextlib
 import enum
 import logging
 import re
+import socket
 import socketserver
 import threading
 
@@ -68,38 +69,76 @@ PRI_PATTERN = re.compile(r'<(?P<value>\d{1,3})>', re.ASCII)
 PRI_FALLBACK = Facility.LOG_USER << 3 | Severity.LOG_ERR
 
 
-class SyslogHandler(socketserver.BaseRequestHandler):
-    def handle(self):
-        data, _ = self.request
-        message = data.decode()
+def handle_message(data):
+    message = data.decode()
 
-        pri = PRI_PATTERN.match(message)
+    pri = PRI_PATTERN.match(message)
 
-        if pri:
-            message = message[pri.end():]
-            pri = int(pri['value'])
-        else:
-            pri = PRI_FALLBACK
+    if pri:
+        message = message[pri.end():]
+        pri = int(pri['value'])
+    else:
+        pri = PRI_FALLBACK
 
-        logger = LOGGERS.get(pri >> 3, LOGGER)
-        level = LEVELS.get(pri & 0b111, logging.ERROR)
+    logger = LOGGERS.get(pri >> 3, LOGGER)
+    level = LEVELS.get(pri & 0b111, logging.ERROR)
 
-        record = logger.makeRecord(
-            name=logger.name,
-            level=level,
-            fn='syslog',
-            lno=0,
-            msg=message,
-            args=None,
-            exc_info=None,
-        )
+    record = logger.makeRecord(
+        name=logger.name,
+        level=level,
+        fn='syslog',
+        lno=0,
+        msg=message,
+        args=None,
+        exc_info=None,
+    )
 
-        logger.handle(record)
+    logger.handle(record)
 
 
 class SyslogServer(socketserver.UnixDatagramServer):
+    MAX_BATCH_SIZE = 256
+
     def __init__(self, address):
-        super().__init__(address, SyslogHandler)
+        # RequestHandlerClass is never used - finish_request() is overridden
+        super().__init__(address, socketserver.BaseRequestHandler)
+
+    def finish_request(self, request, client_address):
+        # Call handle_message() directly instead of instantiating
+        # a request handler object for every datagram
+        data, _ = request
+        handle_message(data)
+
+    def service_actions(self):
+        super().service_actions()
+
+        # serve_forever() handles a single datagram per select() wakeup.
+        # Drain the rest of the queue here, in bounded batches - otherwise
+        # a chatty container could delay shutdown().
+        for _ in range(self.MAX_BATCH_SIZE):
+            try:
+                data, client_address = self.socket.recvfrom(
+                    self.max_packet_size,
+                    socket.MSG_DONTWAIT
+                )
+
+            except OSError:
+                # Queue is empty (BlockingIOError), other errors are ignored
+                # the same way serve_forever() ignores get_request() errors
+                return
+
+            request = (data, self.socket)
+
+            if not self.verify_request(request, client_address):
+                self.shutdown_request(request)
+                continue
+
+            try:
+                self.process_request(request, client_address)
+
+            except Exception:
+                self.handle_error(request, client_address)
+                self.shutdown_request(request)
 
     @property
     def logger(self):
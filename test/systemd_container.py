@@ -1,5 +1,6 @@
 import contextlib
 import functools
+import shlex
 import socket
 import socketserver
 import time
@@ -58,30 +59,21 @@ class SystemdContainer(coreutils_container.CoreutilsContainer):
 
         self._ready = False
 
-    def start(self, **kwargs):
-        timeout = kwargs.pop('timeout', self.podman.timeout)
-        deadline = time.monotonic() + timeout
-
-        super().start(**kwargs, timeout=timeout)
-
-        self.exec(
-            'busctl', '--system', '--watch-bind=true', 'status',
-            **kwargs, timeout=deadline - time.monotonic()
-        )
-
     def wait_system_running(self, **kwargs):
         if self._ready:
             return
 
-        self.exec(
-            'systemctl', 'is-system-running', '--wait',
+        # One round trip instead of two: wait for the system bus socket,
+        # then for systemd to finish booting.
+        self.sh(
+            'busctl --system --watch-bind=true status && systemctl is-system-running --wait',
             **kwargs
         )
 
         self._ready = True
 
     def journal_message(self, msg, **kwargs):
-        self.exec('systemd-cat', **kwargs, input=msg.encode(), interactive=True)
+        self.sh(f'printf "%s\\n" {shlex.quote(msg)} | systemd-cat', **kwargs)
 
     def get_user_dbus_address(self, user, *, env=dict(), **kwargs):
         with contextlib.suppress(KeyError):
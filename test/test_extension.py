@@ -14,7 +14,7 @@ import Xlib.X
 
 from gi.repository import GLib, Gio
 
-from . import ddterm_fixtures, glib_util
+from . import dbus_util, ddterm_fixtures, glib_util
 
 
 LOGGER = logging.getLogger(__name__)
@@ -302,19 +302,33 @@ def wait_move_resize(
 
 
 class Layout:
+    MONITOR_METHODS = ('GetMonitorGeometry', 'GetMonitorWorkarea', 'GetMonitorScale')
+
     def __init__(self, test_interface):
-        self.monitors = [
-            MonitorInfo(
+        n_monitors = test_interface.GetNMonitors(timeout=STARTUP_TIMEOUT_MS)
+
+        replies = dbus_util.call_many(
+            test_interface,
+            [
+                (method_name, GLib.Variant('(i)', (i,)))
+                for i in range(n_monitors)
+                for method_name in self.MONITOR_METHODS
+            ],
+            timeout=STARTUP_TIMEOUT_MS
+        )
+
+        self.monitors = []
+
+        for i in range(n_monitors):
+            geometry, workarea, scale = \
+                replies[i * len(self.MONITOR_METHODS):(i + 1) * len(self.MONITOR_METHODS)]
+
+            self.monitors.append(MonitorInfo(
                 index=i,
-                geometry=Rect(
-                    *test_interface.GetMonitorGeometry('(i)', i, timeout=STARTUP_TIMEOUT_MS)
-                ),
-                workarea=Rect(
-                    *test_interface.GetMonitorWorkarea('(i)', i, timeout=STARTUP_TIMEOUT_MS)
-                ),
-                scale=test_interface.GetMonitorScale('(i)', i, timeout=STARTUP_TIMEOUT_MS)
-            ) for i in range(test_interface.GetNMonitors(timeout=STARTUP_TIMEOUT_MS))
-        ]
+                geometry=Rect(*geometry),
+                workarea=Rect(*workarea),
+                scale=scale
+            ))
 
         self.primary_index = test_interface.GetPrimaryMonitor()
 
@@ -782,6 +796,7 @@ class CommonTests(ddterm_fixtures.DDTermFixtures):
         return True
 
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def valid_parametrization(cls, method_name, params):
         monitor_config = None
         window_size = []
@@ -841,9 +856,11 @@ class CommonTests(ddterm_fixtures.DDTermFixtures):
 
         paramvalues_perclass = collections.defaultdict(list)
 
+        # The filter has to run inside AllPairs: dropping invalid rows afterwards
+        # would also drop the pairs that only those rows covered.
         for params in allpairspy.AllPairs(
             paramranges,
-            filter_func=lambda p: p[0].valid_parametrization(method_name, p[1:]),
+            filter_func=lambda p: p[0].valid_parametrization(method_name, tuple(p[1:])),
         ):
             paramvalues_perclass[params[0]].append(params[1:])
 